@@ -3,9 +3,6 @@ from __future__ import annotations
 from pathlib import Path
 from typing import Union
 
-from rich.console import Console
-from rich.traceback import install
-
 from ..config import get_dump_failed_posts, read_config
 from ..exceptions import JuicenetInputError
 from ..model import JuicenetConfig
@@ -13,13 +10,7 @@ from ..nyuu import Nyuu
 from ..parpar import ParPar
 from ..resume import Resume
 from ..types import JuiceBox, NyuuOutput, ParParOutput, StrPath
-from ..utils import filter_empty_files, get_glob_matches, get_related_files
-
-# Install rich traceback
-install()
-
-# Console object, used by both progressbar and loguru
-console = Console()
+from ..utils import filter_empty_files, get_related_files, list_raw_articles
 
 
 def juicenet(
@@ -159,8 +150,13 @@ def juicenet(
     conf = configurations[scope]
 
     # Check and get `dump-failed-posts` as defined in Nyuu config
-    dump = get_dump_failed_posts(conf)
-    raw_articles = get_glob_matches(dump, ["*"])
+    # Only needed if raw articles are going to be reposted
+    if skip_raw:
+        raw_articles = []
+    else:
+        dump = get_dump_failed_posts(conf)
+        raw_articles = list_raw_articles(dump)
+
     raw_count = len(raw_articles)
 
     # Initialize Resume class
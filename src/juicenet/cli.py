@@ -3,10 +3,14 @@ from typing import Annotated, Optional
 
 from cyclopts import App, Group, Parameter, validators
 from cyclopts.types import ResolvedExistingFile, ResolvedExistingPath
+from rich.traceback import install
 
 from .main import main
 from .version import get_version
 
+# Install rich traceback, only for the CLI so library users keep their own excepthook
+install()
+
 app = App(
     name="juicenet",
     help="CLI tool designed to simplify the process of uploading files to Usenet",
@@ -1,12 +1,41 @@
 import json
+from functools import lru_cache
 from pathlib import Path
-from typing import Union
+from typing import Any, Union
 
 import yaml
 
+try:
+    # Use the libyaml bindings if available, they're much faster than the pure python loader
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
 from .exceptions import JuicenetInputError
 from .model import JuicenetConfig
 
+# Bind the compiled validator once instead of going through `JuicenetConfig.model_validate` on every read
+_VALIDATOR = JuicenetConfig.__pydantic_validator__
+
+
+def _file_version(path: Path) -> tuple[int, int]:
+    """
+    Get the modification time and size of a file, used to invalidate the caches below.
+    The size catches edits within the same tick on filesystems with coarse timestamps (FAT, some SMB/NFS mounts).
+    """
+    stat = path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+@lru_cache(maxsize=32)
+def _read_config(config: Path, version: tuple[int, int]) -> dict[str, Any]:
+    """
+    Reads and parses the yaml config file.
+    `version` is only here to invalidate the cache when the file changes.
+    """
+    data = yaml.load(config.read_bytes(), Loader=SafeLoader) or {}
+    return {key.lower(): value for key, value in data.items() if value is not None}
+
 
 def read_config(config: Union[Path, JuicenetConfig]) -> JuicenetConfig:
     """
@@ -15,9 +44,11 @@ def read_config(config: Union[Path, JuicenetConfig]) -> JuicenetConfig:
     Returns a JuicenetConfig object with the data validated and type casted
     """
     if isinstance(config, Path):
-        data = yaml.safe_load(config.read_text(encoding="utf-8")) or {}
-        lower = {key.lower(): value for key, value in data.items() if value is not None}
-        return JuicenetConfig.model_validate(lower)
+        # Only the parsed yaml is cached. Validation resolves relative paths, checks that they exist
+        # and looks up the default binaries, all of which depend on the current environment.
+        data = _read_config(config, _file_version(config))
+        validated: JuicenetConfig = _VALIDATOR.validate_python(data)
+        return validated
 
     elif isinstance(config, JuicenetConfig):
         return config
@@ -26,9 +57,20 @@ def read_config(config: Union[Path, JuicenetConfig]) -> JuicenetConfig:
         raise JuicenetInputError("Config must be a pathlib.Path or juicenet.JuicenetConfig")
 
 
+@lru_cache(maxsize=32)
+def _read_dump_failed_posts(conf: Path, version: tuple[int, int]) -> str:
+    """
+    Reads `dump-failed-posts` from Nyuu config.
+    `version` is only here to invalidate the cache when the file changes.
+    """
+    data = json.loads(conf.read_bytes())
+    dump: str = data["dump-failed-posts"]
+    return dump
+
+
 def get_dump_failed_posts(conf: Path) -> Path:
     """
     Get the value of `dump-failed-posts` from Nyuu config
     """
-    data = json.loads(conf.read_text(encoding="utf-8"))
-    return Path(data["dump-failed-posts"]).resolve()
+    # Resolve outside the cache because relative paths depend on the current working directory
+    return Path(_read_dump_failed_posts(conf, _file_version(conf))).resolve()
@@ -3,14 +3,16 @@ from __future__ import annotations
 import json
 import signal
 import sys
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from pprint import pformat
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from loguru import logger as _loguru_logger
 from pydantic import ValidationError
 from rich.console import Console
-from rich.traceback import install
 
 from .bar import progress_bar
 from .config import get_dump_failed_posts, read_config
@@ -18,8 +20,9 @@ from .log import get_logger
 from .nyuu import Nyuu
 from .parpar import ParPar
 from .resume import Resume
-from .types import InternalJuicenetOutput, SubprocessOutput
+from .types import InternalJuicenetOutput, NyuuOutput, ParParOutput, SubprocessOutput
 from .utils import (
+    cancel_on_interrupt,
     delete_files,
     filter_empty_files,
     filter_par2_files,
@@ -27,19 +30,26 @@ from .utils import (
     get_files,
     get_glob_matches,
     get_related_files,
+    list_raw_articles,
     map_file_to_pars,
     move_files,
 )
 from .version import get_version
 
+if TYPE_CHECKING:
+    from rich.progress import Progress, TaskID
+
 # Supress keyboardinterrupt traceback because I hate it
 signal.signal(signal.SIGINT, lambda x, y: sys.exit(1))
 
-# Install rich traceback
-install()
 
-# Console object, used by both progressbar and loguru
-console = Console()
+@lru_cache(maxsize=None)
+def get_console() -> Console:
+    """
+    Console object, used by both progressbar and loguru.
+    Created on first use so merely importing this module stays cheap.
+    """
+    return Console()
 
 
 def main(
@@ -63,6 +73,8 @@ def main(
     Do stuff here
     """
 
+    console = get_console()
+
     # Configure logger
     level = "DEBUG" if debug else "INFO"
     logger = get_logger(logger=_loguru_logger, level=level, sink=console)  # type: ignore
@@ -88,6 +100,8 @@ def main(
     exts = extensions or config_data.extensions
     related_exts = config_data.related_extensions
     parpar_args = config_data.parpar_args
+    parpar_workers = config_data.parpar_workers
+    nyuu_concurrency = config_data.nyuu_concurrency
 
     appdata_dir = config_data.appdata_dir_path
     appdata_dir.mkdir(parents=True, exist_ok=True)
@@ -104,19 +118,24 @@ def main(
     scope = "public" if public else "private"
     conf = configurations[scope]
 
+    # Raw articles are only touched when clearing or reposting them,
+    # every other mode can skip reading the Nyuu config entirely
+    uses_raw = clear_raw or only_raw or not (skip_raw or only_nyuu or only_parpar or move or clear_resume)
+
     # Check and get `dump-failed-posts` as defined in Nyuu config
-    try:
-        dump = get_dump_failed_posts(conf)
-    except json.JSONDecodeError as error:
-        logger.error(error)
-        logger.error("Please check your Nyuu config and ensure it is valid")
-        sys.exit(1)
-    except KeyError as key:
-        logger.error(f"{key} is not defined in your Nyuu config")
-        sys.exit(1)
-    except FileNotFoundError as error:
-        logger.error(f"No such file: {error.filename}")
-        sys.exit(1)
+    if uses_raw:
+        try:
+            dump = get_dump_failed_posts(conf)
+        except json.JSONDecodeError as error:
+            logger.error(error)
+            logger.error("Please check your Nyuu config and ensure it is valid")
+            sys.exit(1)
+        except KeyError as key:
+            logger.error(f"{key} is not defined in your Nyuu config")
+            sys.exit(1)
+        except FileNotFoundError as error:
+            logger.error(f"No such file: {error.filename}")
+            sys.exit(1)
 
     logger.debug(f"Version: {get_version()}")
 
@@ -127,7 +146,8 @@ def main(
     logger.info(f"ParPar: {parpar_bin}")
     logger.info(f"Nyuu Config: {conf}")
     logger.info(f"NZB Output: {nzb_out}")
-    logger.info(f"Raw Articles: {dump}")
+    if uses_raw:
+        logger.info(f"Raw Articles: {dump}")
     logger.info(f"Appdata Directory: {appdata_dir}")
     logger.info(f"Working Directory: {work_dir or path}")
 
@@ -137,10 +157,12 @@ def main(
         logger.info(f"Extensions: {exts}")
 
     logger.info(f"Related Extensions: {related_exts}")
+    logger.debug(f"ParPar Workers: {parpar_workers}")
+    logger.debug(f"Nyuu Concurrency: {nyuu_concurrency}")
 
     # --clear-raw
     if clear_raw:
-        raw = get_glob_matches(dump, ["*"])
+        raw = list_raw_articles(dump)
         count = len(raw)
         delete_files(raw)
         logger.info(f"Deleted {count} raw articles(s)")
@@ -160,9 +182,28 @@ def main(
         sys.exit(0)
 
     # Check if there are any raw files from previous runs
-    raw_articles = get_glob_matches(dump, ["*"])
+    raw_articles = list_raw_articles(dump) if uses_raw else []
     raw_count = len(raw_articles)
 
+    def repost_raw_articles(progress: Progress, task_raw: TaskID) -> dict[Path, SubprocessOutput]:
+        """
+        Repost all the raw articles from previous runs
+        """
+        output = {}
+
+        for article in raw_articles:
+            raw_out = nyuu.repost_raw(article=article)
+
+            if raw_out.returncode == 0:
+                logger.success(article.name)
+            else:
+                logger.error(article.name)
+
+            progress.update(task_raw, advance=1)
+            output[article] = SubprocessOutput(raw=raw_out)
+
+        return output
+
     # --only-raw
     if only_raw:
         output = {}
@@ -171,17 +212,7 @@ def main(
         else:
             with progress_bar(console=console, disable=debug) as progress:
                 task_raw = progress.add_task("Raw...", total=raw_count)
-
-                for article in raw_articles:
-                    raw_out = nyuu.repost_raw(article=article)
-
-                    if raw_out.returncode == 0:
-                        logger.success(article.name)
-                    else:
-                        logger.error(article.name)
-
-                    progress.update(task_raw, advance=1)
-                    output[article] = SubprocessOutput(raw=raw_out)
+                output = repost_raw_articles(progress, task_raw)
 
         return InternalJuicenetOutput(articles=output)
 
@@ -212,18 +243,18 @@ def main(
 
     if move:  # --move
         logger.info("Moving file(s)")
-        move_files(files)
-        logger.success("File(s) moved successfully")
+        moved = move_files(files)
+        logger.success(f"Moved {len(moved)} file(s) successfully")
         sys.exit(0)
 
-    total = len(files)
-    logger.debug(f"Total files: {total}")
+    found_count = len(files)
+    logger.debug(f"Total files: {found_count}")
 
     # Filter out empty paths and remove anything that isn't a directory or file
     files = filter_empty_files(files)
 
     non_empty_count = len(files)
-    logger.debug(f"Empty files: {total-non_empty_count}")
+    logger.debug(f"Empty files: {found_count - non_empty_count}")
     logger.debug(f"Total files left: {non_empty_count}")
 
     if not files:
@@ -242,6 +273,91 @@ def main(
         )
         sys.exit(1)
 
+    # `files` doesn't change past this point
+    total = len(files)
+
+    def upload(
+        file: Path,
+        related_files: Optional[list[Path]],
+        par2files: list[Path],
+        progress: Progress,
+        task_nyuu: TaskID,
+    ) -> NyuuOutput:
+        """
+        Upload a file along with its par2 files
+        """
+        nyuu_out = nyuu.upload(file=file, related_files=related_files, par2files=par2files)
+
+        if nyuu_out.success:
+            logger.success(file.name)
+            # Only log to resume if process was successful
+            resume.log_file_info(file)
+        else:
+            logger.error(file.name)
+
+        progress.update(task_nyuu, advance=1)
+        return nyuu_out
+
+    def parpar_and_nyuu(
+        progress: Progress, task_parpar: TaskID, task_nyuu: TaskID, nyuu_pool: ThreadPoolExecutor
+    ) -> dict[Path, SubprocessOutput]:
+        """
+        Run ParPar and Nyuu on every file
+
+        ParPar is CPU bound while Nyuu is network bound, so each gets its own bounded pool.
+        A file is handed over to Nyuu as soon as its par2 files are ready, which lets
+        uploads overlap with par2 generation of the remaining files.
+
+        The Nyuu pool is passed in so that every Nyuu process in a run shares the same
+        `nyuu_concurrency` budget, as they all count against the provider's connection limit.
+
+        ParPar is usually much faster than Nyuu, so it's only allowed to run a few files ahead.
+        Otherwise the par2 files of the entire batch would pile up in the working directory.
+        """
+        # Every slot is a file whose par2 files are on disk and haven't been uploaded yet
+        slots = threading.BoundedSemaphore(parpar_workers + nyuu_concurrency)
+
+        def upload_and_release(file: Path, related_files: Optional[list[Path]], par2files: list[Path]) -> NyuuOutput:
+            try:
+                return upload(file, related_files, par2files, progress, task_nyuu)
+            finally:
+                slots.release()
+
+        def generate_and_upload(
+            file: Path, related_files: Optional[list[Path]]
+        ) -> tuple[ParParOutput, Future[NyuuOutput]]:
+            try:
+                parpar_out = parpar.generate_par2_files(file, related_files=related_files)
+                progress.update(task_parpar, advance=1)
+                return parpar_out, nyuu_pool.submit(upload_and_release, file, related_files, parpar_out.par2files)
+            except BaseException:
+                slots.release()
+                raise
+
+        output = {}
+
+        with ThreadPoolExecutor(parpar_workers) as parpar_pool, cancel_on_interrupt(parpar_pool, nyuu_pool):
+            jobs = {}
+
+            for file in files:
+                related_files = get_related_files(file, exts=related_exts)
+
+                if related_files:
+                    logger.info(f"Found {len(related_files)} related files")
+                    logger.debug(pformat(related_files))
+                else:
+                    logger.info(f"No related files found for {file.name}")
+
+                slots.acquire()  # Wait for an upload to finish if ParPar is too far ahead
+                jobs[file] = parpar_pool.submit(generate_and_upload, file, related_files)
+
+            # Keep the output in the same order as the input
+            for file, job in jobs.items():
+                parpar_out, nyuu_future = job.result()
+                output[file] = SubprocessOutput(nyuu=nyuu_future.result(), parpar=parpar_out)
+
+        return output
+
     if only_parpar:  # --parpar
         logger.debug("Only running ParPar")
 
@@ -251,7 +367,6 @@ def main(
         output = {}
 
         with progress_bar(console=console, disable=debug) as progress:
-            total = len(files)
             task_parpar = progress.add_task("ParPar...", total=total)
 
             for file in files:
@@ -263,21 +378,17 @@ def main(
                 else:
                     logger.info(f"No related files found for {file.name}")
 
-                if resume.already_uploaded(file):
-                    logger.info(f"Skipping: {file.name} - Already uploaded")
-                    progress.update(task_parpar, advance=1)
-                else:
-                    parpar_out = parpar.generate_par2_files(file, related_files=related_files)
+                parpar_out = parpar.generate_par2_files(file, related_files=related_files)
 
-                    if parpar_out.success:
-                        logger.success(file.name)
-                        # Only log to resume if process was successful
-                        resume.log_file_info(file)
-                    else:
-                        logger.error(file.name)
+                if parpar_out.success:
+                    logger.success(file.name)
+                    # Only log to resume if process was successful
+                    resume.log_file_info(file)
+                else:
+                    logger.error(file.name)
 
-                    progress.update(task_parpar, advance=1)
-                    output[file] = SubprocessOutput(parpar=parpar_out)
+                progress.update(task_parpar, advance=1)
+                output[file] = SubprocessOutput(parpar=parpar_out)
 
         return InternalJuicenetOutput(files=output)
 
@@ -292,33 +403,24 @@ def main(
         output = {}
 
         with progress_bar(console=console, disable=debug) as progress:
-            total = len(files)
             task_nyuu = progress.add_task("Nyuu...", total=total)
 
-            for file in files:
-                related_files = get_related_files(file, exts=related_exts)
-
-                if related_files:
-                    logger.info(f"Found {len(related_files)} related files")
-                    logger.debug(pformat(related_files))
-                else:
-                    logger.info(f"No related files found for {file.name}")
+            with ThreadPoolExecutor(nyuu_concurrency) as nyuu_pool, cancel_on_interrupt(nyuu_pool):
+                uploads = {}
 
-                if resume.already_uploaded(file):
-                    logger.info(f"Skipping: {file.name} - Already uploaded")
-                    progress.update(task_nyuu, advance=1)
-                else:
-                    nyuu_out = nyuu.upload(file=file, related_files=related_files, par2files=par2files[file])
+                for file in files:
+                    related_files = get_related_files(file, exts=related_exts)
 
-                    if nyuu_out.success:
-                        logger.success(file.name)
-                        # Only log to resume if process was successful
-                        resume.log_file_info(file)
+                    if related_files:
+                        logger.info(f"Found {len(related_files)} related files")
+                        logger.debug(pformat(related_files))
                     else:
-                        logger.error(file.name)
+                        logger.info(f"No related files found for {file.name}")
 
-                    progress.update(task_nyuu, advance=1)
-                    output[file] = SubprocessOutput(nyuu=nyuu_out)
+                    uploads[file] = nyuu_pool.submit(upload, file, related_files, par2files[file], progress, task_nyuu)
+
+                for file, future in uploads.items():
+                    output[file] = SubprocessOutput(nyuu=future.result())
 
         return InternalJuicenetOutput(files=output)
 
@@ -327,97 +429,39 @@ def main(
         output = {}
 
         with progress_bar(console=console, disable=debug) as progress:
-            total = len(files)
 
             task_parpar = progress.add_task("ParPar...", total=total)
             task_nyuu = progress.add_task("Nyuu...", total=total)
 
-            for file in files:
-                related_files = get_related_files(file, exts=related_exts)
-
-                if related_files:
-                    logger.info(f"Found {len(related_files)} related files")
-                    logger.debug(pformat(related_files))
-                else:
-                    logger.info(f"No related files found for {file.name}")
-
-                if resume.already_uploaded(file):
-                    logger.info(f"Skipping: {file.name} - Already uploaded")
-                    progress.update(task_parpar, advance=1)
-                    progress.update(task_nyuu, advance=1)
-                else:
-                    parpar_out = parpar.generate_par2_files(file, related_files=related_files)
-                    progress.update(task_parpar, advance=1)
-                    nyuu_out = nyuu.upload(file=file, related_files=related_files, par2files=parpar_out.par2files)
-
-                    if nyuu_out.success:
-                        logger.success(file.name)
-                        # Only log to resume if process was successful
-                        resume.log_file_info(file)
-                    else:
-                        logger.error(file.name)
-
-                    progress.update(task_nyuu, advance=1)
-                    output[file] = SubprocessOutput(nyuu=nyuu_out, parpar=parpar_out)
+            with ThreadPoolExecutor(nyuu_concurrency) as nyuu_pool, cancel_on_interrupt(nyuu_pool):
+                output = parpar_and_nyuu(progress, task_parpar, task_nyuu, nyuu_pool)
 
         return InternalJuicenetOutput(files=output)
 
     else:  # default
         output = {}
-
-        if raw_count:
-            logger.info(f"Found {raw_count} raw article(s). Attempting to Repost...")
-
-            rawoutput = {}
-
-            with progress_bar(console=console, transient=True, disable=debug) as progress:
-                task_raw = progress.add_task("Raw...", total=raw_count)
-
-                for article in raw_articles:
-                    raw_out = nyuu.repost_raw(article=article)
-
-                    if raw_out.returncode == 0:
-                        logger.success(article.name)
-                    else:
-                        logger.error(article.name)
-
-                    progress.update(task_raw, advance=1)
-                    rawoutput[article] = SubprocessOutput(raw=raw_out)
-        else:
-            rawoutput = None
+        rawoutput = None
 
         with progress_bar(console=console, disable=debug) as progress:
-            total = len(files)
-
-            task_parpar = progress.add_task("ParPar...", total=total)
-            task_nyuu = progress.add_task("Nyuu...", total=total)
-
-            for file in files:
-                related_files = get_related_files(file, exts=related_exts)
-
-                if related_files:
-                    logger.info(f"Found {len(related_files)} related files")
-                    logger.debug(pformat(related_files))
-                else:
-                    logger.info(f"No related files found for {file.name}")
-
-                if resume.already_uploaded(file):
-                    logger.info(f"Skipping: {file.name} - Already uploaded")
-                    progress.update(task_parpar, advance=1)
-                    progress.update(task_nyuu, advance=1)
-                else:
-                    parpar_out = parpar.generate_par2_files(file, related_files=related_files)
-                    progress.update(task_parpar, advance=1)
-                    nyuu_out = nyuu.upload(file=file, related_files=related_files, par2files=parpar_out.par2files)
-
-                    if nyuu_out.success:
-                        logger.success(file.name)
-                        # Only log to resume if process was successful
-                        resume.log_file_info(file)
-                    else:
-                        logger.error(file.name)
-
-                    progress.update(task_nyuu, advance=1)
-                    output[file] = SubprocessOutput(nyuu=nyuu_out, parpar=parpar_out)
+            # Reposting raw articles doesn't depend on the new uploads, so it's queued first in the same
+            # Nyuu pool and ParPar gets started on the files in the meantime. Sharing the pool keeps the
+            # number of Nyuu processes, and thus connections, within `nyuu_concurrency`.
+            with ThreadPoolExecutor(nyuu_concurrency) as nyuu_pool, cancel_on_interrupt(nyuu_pool):
+                raw_future: Optional[Future[dict[Path, SubprocessOutput]]] = None
+
+                if raw_count:
+                    logger.info(f"Found {raw_count} raw article(s). Attempting to Repost...")
+                    task_raw = progress.add_task("Raw...", total=raw_count)
+                    raw_future = nyuu_pool.submit(repost_raw_articles, progress, task_raw)
+                    # Hide the raw progress once it's done, it's not interesting after that
+                    raw_future.add_done_callback(lambda _: progress.remove_task(task_raw))
+
+                task_parpar = progress.add_task("ParPar...", total=total)
+                task_nyuu = progress.add_task("Nyuu...", total=total)
+
+                output = parpar_and_nyuu(progress, task_parpar, task_nyuu, nyuu_pool)
+
+                if raw_future:
+                    rawoutput = raw_future.result()
 
         return InternalJuicenetOutput(files=output, articles=rawoutput)
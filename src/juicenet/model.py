@@ -3,7 +3,7 @@ from shutil import which
 from tempfile import TemporaryDirectory
 from typing import Annotated, Optional
 
-from pydantic import BaseModel, DirectoryPath, Field, FilePath, field_validator
+from pydantic import BaseModel, DirectoryPath, Field, FilePath, PositiveInt, field_validator
 
 
 # fmt: off
@@ -39,6 +39,10 @@ class JuicenetConfig(BaseModel):
         Path to a specific temporary directory if `use_temp_dir` is `True`. If unspecified, it uses `%Temp%` or `/tmp`
     appdata_dir_path : Path, optional
         The path to the folder where Juicenet will store its data. Default is `~/.juicenet`
+    parpar_workers : PositiveInt, optional
+        The maximum number of ParPar processes to run at once. Default is `1`
+    nyuu_concurrency : PositiveInt, optional
+        The maximum number of Nyuu processes to run at once. Default is `1`
     """
 
     parpar: Annotated[FilePath, Field(validate_default=True)] = which("parpar") # type: ignore
@@ -78,6 +82,12 @@ class JuicenetConfig(BaseModel):
     appdata_dir_path: Path = Path.home() / ".juicenet"
     """The path to the folder where juicenet will store it's data"""
 
+    parpar_workers: PositiveInt = 1
+    """The maximum number of ParPar processes to run at once"""
+
+    nyuu_concurrency: PositiveInt = 1
+    """The maximum number of Nyuu processes to run at once"""
+
     @field_validator("parpar", "nyuu", "nyuu_config_private", "nzb_output_path", "nyuu_config_public", "temp_dir_path", "appdata_dir_path")
     @classmethod
     def resolve_path(cls, path: Path) -> Path:
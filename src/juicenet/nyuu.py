@@ -1,14 +1,70 @@
+import errno
+import os
 import shlex
 import shutil
 import subprocess
+import threading
+from collections import deque
 from pathlib import Path
-from typing import Optional
+from typing import IO, Any, Optional
+from uuid import uuid4
 
 from loguru import logger
 
 from .types import ArticleFilePath, NyuuOutput, NZBFilePath, PAR2FilePath, RawOutput
 from .utils import delete_files
 
+# Number of trailing lines of Nyuu's stdout/stderr to keep when capturing output
+OUTPUT_TAIL_LINES = 1000
+
+
+def _drain(pipe: IO[str], lines: deque[str]) -> None:
+    """
+    Read a pipe until EOF, keeping the lines that fit in `lines`
+    """
+    try:
+        lines.extend(pipe)
+    finally:
+        # If reading fails midway, keep draining the raw bytes anyway,
+        # otherwise Nyuu would block forever on a full pipe buffer
+        while pipe.buffer.read(65536):  # type: ignore[attr-defined]
+            pass
+
+
+def _run(args: list[Any], cwd: Optional[Path] = None, capture_output: bool = True) -> subprocess.CompletedProcess[str]:
+    """
+    Run Nyuu and return the result just like `subprocess.run` would
+
+    Nyuu can be very chatty on long uploads, so instead of buffering all of it in memory,
+    stdout and stderr are streamed and only the last `OUTPUT_TAIL_LINES` lines are kept.
+    If output isn't being captured, it goes straight to the terminal.
+    """
+    if not capture_output:
+        return subprocess.run(args, cwd=cwd, encoding="utf-8")
+
+    stdout: deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+    stderr: deque[str] = deque(maxlen=OUTPUT_TAIL_LINES)
+
+    # Nyuu can echo filenames that aren't valid UTF-8, replace those bytes instead of failing to read them
+    with subprocess.Popen(
+        args, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, encoding="utf-8", errors="replace"
+    ) as process:
+        # Drain both pipes at once so Nyuu never blocks on a full pipe buffer
+        readers = [
+            threading.Thread(target=_drain, args=(process.stdout, stdout), daemon=True),
+            threading.Thread(target=_drain, args=(process.stderr, stderr), daemon=True),
+        ]
+
+        for reader in readers:
+            reader.start()
+
+        for reader in readers:
+            reader.join()
+
+        returncode = process.wait()
+
+    return subprocess.CompletedProcess(process.args, returncode, "".join(stdout), "".join(stderr))
+
 
 class Nyuu:
     """
@@ -60,8 +116,10 @@ class Nyuu:
         self.scope = scope
         self.debug = debug
         self.bdmv_naming = bdmv_naming
+        # Output directories that are known to exist, used to skip redundant mkdir calls
+        self._created_dirs: set[Path] = set()
 
-    def _move_nzb(self, file: Path, basedir: Path, clean_nzb: str, nzb: str) -> NZBFilePath:
+    def _move_nzb(self, file: Path, src: Path, nzb: str) -> NZBFilePath:
         """
         Move NZB to a specified output path in a somewhat sorted manner
         """
@@ -70,13 +128,22 @@ class Nyuu:
         subdir = file.relative_to(self.path)  # /extras/specials/episode.mkv
         subdir = subdir.parent  # /extras/specials/
 
-        src = self.workdir / clean_nzb if self.workdir else basedir / clean_nzb
         dst = self.outdir / self.scope / self.path.name / subdir  # ./out/private/show/extras/specials/
-        dst.mkdir(parents=True, exist_ok=True)
+        if dst not in self._created_dirs:
+            dst.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(dst)
         dst = dst / nzb  # ./out/private/show/extras/specials/episode.mkv.nzb
-        shutil.move(src, dst)  # ./workdir/01.nzb -> ./out/private/show/extras/specials/episode.mkv.nzb
 
-        logger.debug(f"NZB Move: {src} -> {dst}")
+        # ./workdir/01.nzb -> ./out/private/show/extras/specials/episode.mkv.nzb
+        try:
+            # A plain rename is a single syscall when both paths are on the same filesystem
+            os.replace(src, dst)
+        except OSError as error:
+            if error.errno != errno.EXDEV:
+                raise
+            shutil.move(src, dst)  # Different filesystems, fall back to copying
+
+        logger.debug("NZB Move: {} -> {}", src, dst)
 
         return dst.resolve()
 
@@ -110,23 +177,30 @@ class Nyuu:
         else:
             files = [file]
 
-        nyuu = [self.bin] + ["--config", self.conf] + ["--out", clean_nzb] + files + par2files
+        if self.workdir:
+            # Every upload shares the working directory, so prefix the NZB with a unique id
+            # to keep concurrent uploads of files with the same name from overwriting each other
+            out = f"{uuid4().hex.upper()[:10]}-{clean_nzb}"
+        else:
+            out = clean_nzb
+
+        nyuu = [self.bin] + ["--config", self.conf] + ["--out", out] + files + par2files
 
-        logger.debug(shlex.join(str(arg) for arg in nyuu))
+        logger.opt(lazy=True).debug("{}", lambda: shlex.join(str(arg) for arg in nyuu))
 
         cwd = self.workdir if self.workdir else file.parent  # this is where nyuu will be executed
-        process = subprocess.run(nyuu, cwd=cwd, capture_output=capture_output, encoding="utf-8")  # type: ignore
+        process = _run(nyuu, cwd=cwd, capture_output=capture_output)
 
         if process.returncode in [0, 32]:
             # move completed nzb to output dir
-            outpath = self._move_nzb(file=file, basedir=cwd, clean_nzb=clean_nzb, nzb=nzb)
+            outpath = self._move_nzb(file=file, src=cwd / out, nzb=nzb)
 
             # Cleanup par2 files for the uploaded file
             if delete_par2files:
                 delete_files(par2files)
 
             return NyuuOutput(
-                nzb=outpath.resolve(),
+                nzb=outpath,
                 success=True,
                 args=process.args,
                 returncode=process.returncode,
@@ -159,9 +233,9 @@ class Nyuu:
             ]
         )
 
-        logger.debug(shlex.join(str(arg) for arg in nyuu))
+        logger.opt(lazy=True).debug("{}", lambda: shlex.join(str(arg) for arg in nyuu))
 
-        process = subprocess.run(nyuu, capture_output=capture_output, encoding="utf-8")  # type: ignore
+        process = _run(nyuu, capture_output=capture_output)
 
         if process.returncode in [0, 32]:
             return RawOutput(
@@ -94,7 +94,7 @@ class ParPar:
             + files
         )
 
-        logger.debug(shlex.join(str(arg) for arg in parpar))
+        logger.opt(lazy=True).debug("{}", lambda: shlex.join(str(arg) for arg in parpar))
 
         # Get the working directory
         cwd = self._get_workdir(file)
@@ -102,9 +102,14 @@ class ParPar:
         # Execute ParPar and generate `.par2` files
         process = subprocess.run(parpar, cwd=cwd, capture_output=capture_output, encoding="utf-8")
 
+        # Match ParPar's exact output names, a plain prefix glob would also pick up
+        # the par2 files of any other file whose name starts with the same prefix
+        name = glob.escape(file.name)
+        par2files = list(cwd.glob(f"{name}.par2")) + list(cwd.glob(f"{name}.vol*.par2"))
+
         if process.returncode == 0:
             return ParParOutput(
-                par2files=list(cwd.glob(f"{glob.escape(file.name)}*.par2")),
+                par2files=par2files,
                 filepathformat=filepathformat,
                 filepathbase=filepathbase,
                 success=True,
@@ -115,7 +120,7 @@ class ParPar:
             )
         else:
             return ParParOutput(
-                par2files=list(cwd.glob(f"{glob.escape(file.name)}*.par2")),
+                par2files=par2files,
                 filepathformat=filepathformat,
                 filepathbase=filepathbase,
                 success=False,
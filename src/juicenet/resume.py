@@ -1,6 +1,7 @@
 import csv
+import threading
 from pathlib import Path
-from typing import Any, Union
+from typing import Any, Mapping, Union
 
 from loguru import logger
 
@@ -28,6 +29,20 @@ class Resume:
         self.path = path
         self.scope = scope
         self.disable = disable
+        # Guards the resume file when files are being processed concurrently
+        self._lock = threading.Lock()
+        # Resume data is read once and kept in memory, so lookups never have to touch the file
+        self._uploaded: set[tuple[Any, ...]] = set()
+
+        if not self.disable:
+            self._uploaded = {self._as_key(info) for info in self.read_resume()}
+
+    @staticmethod
+    def _as_key(info: Mapping[Any, Any]) -> tuple[Any, ...]:
+        """
+        Turn the information about a file or folder into a hashable key
+        """
+        return (info.get("name"), info.get("size"), info.get("count"), info.get("scope"))
 
     def write_resume(self, info: dict[str, str]) -> None:
         """
@@ -44,11 +59,12 @@ class Resume:
         }
         ```
         """
-        csv.DictWriter(
-            self.path.open("a", encoding="utf-8"),
-            fieldnames=["name", "size", "count", "scope"],
-            quoting=csv.QUOTE_ALL,
-        ).writerow(info)
+        with self._lock, self.path.open("a", encoding="utf-8") as resume:
+            csv.DictWriter(
+                resume,
+                fieldnames=["name", "size", "count", "scope"],
+                quoting=csv.QUOTE_ALL,
+            ).writerow(info)
 
     def read_resume(self) -> tuple[dict[Union[str, Any], Union[str, Any]], ...]:
         """
@@ -64,13 +80,14 @@ class Resume:
         ```
 
         """
-        data = tuple(
-            csv.DictReader(
-                self.path.open("r", encoding="utf-8"),
-                fieldnames=["name", "size", "count", "scope"],
-                quoting=csv.QUOTE_ALL,
+        with self._lock, self.path.open("r", encoding="utf-8") as resume:
+            data = tuple(
+                csv.DictReader(
+                    resume,
+                    fieldnames=["name", "size", "count", "scope"],
+                    quoting=csv.QUOTE_ALL,
+                )
             )
-        )
         return data
 
     def log_file_info(self, file: Path) -> None:
@@ -81,6 +98,7 @@ class Resume:
             info = get_file_info(file)
             info["scope"] = self.scope
             self.write_resume(info)
+            self._uploaded.add(self._as_key(info))
             logger.debug(f"Saving to resume: {info}")
 
     def already_uploaded(self, file: Path) -> bool:
@@ -88,12 +106,10 @@ class Resume:
         Check if a given file is already uploaded by juicenet
         """
         if not self.disable:
-            resume_data = self.read_resume()
-
             info = get_file_info(file)
             info["scope"] = self.scope
 
-            if info in resume_data:
+            if self._as_key(info) in self._uploaded:
                 return True
 
             return False
@@ -106,12 +122,11 @@ class Resume:
         """
         if not self.disable:
             not_uploaded = []
-            resume_data = self.read_resume()
 
             for file in files:
                 info = get_file_info(file)
                 info["scope"] = self.scope
-                if info in resume_data:
+                if self._as_key(info) in self._uploaded:
                     logger.info(f"Skipping: {file.name} - Already uploaded")
                 else:
                     not_uploaded.append(file)
@@ -126,4 +141,5 @@ class Resume:
         Clear resume data
         """
         self.path.unlink(missing_ok=True)
+        self._uploaded.clear()
         logger.info(f"Cleared {self.path}")
@@ -26,9 +26,9 @@ class NyuuOutput:
     returncode : int
         Nyuu's exit code.
     stdout : str
-        Nyuu's stdout.
+        Nyuu's stdout, limited to the last `OUTPUT_TAIL_LINES` lines when captured.
     stderr : str
-        Nyuu's stderr.
+        Nyuu's stderr, limited to the last `OUTPUT_TAIL_LINES` lines when captured.
 
     Notes
     -----
@@ -52,10 +52,10 @@ class NyuuOutput:
     """Nyuu's exit code."""
 
     stdout: str
-    """Nyuu's stdout."""
+    """Nyuu's stdout, limited to the last `OUTPUT_TAIL_LINES` lines when captured."""
 
     stderr: str
-    """Nyuu's stderr."""
+    """Nyuu's stderr, limited to the last `OUTPUT_TAIL_LINES` lines when captured."""
 
 
 @dataclass(order=True)
@@ -74,9 +74,9 @@ class RawOutput:
     returncode : int
         Nyuu's exit code.
     stdout : str
-        Nyuu's stdout.
+        Nyuu's stdout, limited to the last `OUTPUT_TAIL_LINES` lines when captured.
     stderr : str
-        Nyuu's stderr.
+        Nyuu's stderr, limited to the last `OUTPUT_TAIL_LINES` lines when captured.
 
     Notes
     -----
@@ -100,10 +100,10 @@ class RawOutput:
     """Nyuu's exit code."""
 
     stdout: str
-    """Nyuu's stdout."""
+    """Nyuu's stdout, limited to the last `OUTPUT_TAIL_LINES` lines when captured."""
 
     stderr: str
-    """Nyuu's stderr."""
+    """Nyuu's stderr, limited to the last `OUTPUT_TAIL_LINES` lines when captured."""
 
 
 @dataclass(order=True)
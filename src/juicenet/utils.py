@@ -1,22 +1,32 @@
 import glob
+import os
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from fnmatch import fnmatch
 from pathlib import Path
 from typing import Optional
 
 from loguru import logger
 from natsort import natsorted
 
-from .types import PAR2FilePath
+from .types import ArticleFilePath, PAR2FilePath
 
 
 def get_files(path: Path, exts: list[str]) -> list[Path]:
     """
     Get all the files with the relevant extensions
+
+    This walks the tree once and matches every extension against each entry,
+    rather than doing a separate recursive glob per extension.
     """
+    patterns = [f"*.{ext.strip('.')}" for ext in exts]
     files = []
 
-    for ext in exts:
-        matches = list(path.rglob(f"*.{ext.strip('.')}"))
-        files.extend(matches)
+    for root, dirnames, filenames in os.walk(path):
+        for name in dirnames + filenames:
+            if any(fnmatch(name, pattern) for pattern in patterns):
+                files.append(Path(root, name))
 
     return natsorted(files)
 
@@ -34,6 +44,22 @@ def get_glob_matches(path: Path, patterns: list[str]) -> list[Path]:
     return natsorted(files)
 
 
+def list_raw_articles(dump: Path) -> list[ArticleFilePath]:
+    """
+    Get all the raw articles dumped by Nyuu in `dump-failed-posts`
+
+    This only needs a flat listing of files, so a single `os.scandir`
+    is used instead of globbing, which also saves a `stat` per entry.
+    """
+    try:
+        with os.scandir(dump) as entries:
+            articles = [Path(entry.path) for entry in entries if entry.is_file(follow_symlinks=False)]
+    except FileNotFoundError:  # Nyuu hasn't dumped anything yet
+        return []
+
+    return natsorted(articles)
+
+
 def get_related_files(file: Path, exts: list[str]) -> Optional[list[Path]]:
     """
     Sometimes releasers include unmuxed files
@@ -163,15 +189,24 @@ def filter_par2_files(files: list[Path]) -> list[Path]:
     """
     Filter out any `.par2` files present in the given
     list of path. There's no reason to process these.
+
+    The order of the given list is preserved.
     """
 
-    filtered = []
+    return [file for file in files if file.suffix.lower() != ".par2"]
 
-    for file in files:
-        if not file.suffix.lower() == ".par2":
-            filtered.append(file)
 
-    return natsorted(filtered)
+def _is_non_empty(path: Path) -> bool:
+    """
+    Check if a path is either a non-empty file or a directory with at least one non-empty file
+    """
+    if path.is_file():
+        return path.stat().st_size > 0
+
+    elif path.is_dir():
+        return any(item.is_file() and item.stat().st_size > 0 for item in path.rglob("*"))
+
+    return False
 
 
 def filter_empty_files(files: list[Path]) -> list[Path]:
@@ -185,20 +220,47 @@ def filter_empty_files(files: list[Path]) -> list[Path]:
     on it's own but `Nyuu.upload()` expects an nzb for every
     file passed. So I'll remove these before passing
     it further in the script.
+
+    The order of the given list is preserved.
     """
-    filtered = []
+    # Every check is a handful of stat calls, which can be slow on network filesystems,
+    # so run them concurrently in a bounded pool
+    with ThreadPoolExecutor(max_workers=32) as executor:
+        non_empty = list(executor.map(_is_non_empty, files))
 
-    for file in files:
-        if file.is_file() and file.stat().st_size > 0:
-            filtered.append(file)
+    return [file for file, keep in zip(files, non_empty) if keep]
 
-        elif file.is_dir():
-            for item in list(file.rglob("*")):
-                if item.is_file() and item.stat().st_size > 0:
-                    filtered.append(file)
-                    break
 
-    return natsorted(filtered)
+def _scan_par2_files(directory: Path) -> dict[str, list[PAR2FilePath]]:
+    """
+    List all the `.par2` files in a directory, grouped by the name of the file they belong to
+    """
+    grouped: dict[str, list[PAR2FilePath]] = {}
+
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if not (entry.name.endswith(".par2") and entry.is_file()):
+                    continue
+
+                stem = entry.name[: -len(".par2")]
+
+                # The first par2 file doesn't have the word `vol` in it: `foobar.mkv.par2`
+                owners = {stem}
+
+                # Rest of the par2 files strictly follow the `foobar.mkv.vol01+02.par2` naming scheme
+                start = stem.find(".vol")
+                while start != -1:
+                    owners.add(stem[:start])
+                    start = stem.find(".vol", start + 1)
+
+                for owner in owners:
+                    grouped.setdefault(owner, []).append(Path(entry.path))
+
+    except FileNotFoundError:
+        pass
+
+    return grouped
 
 
 def map_file_to_pars(basedir: Optional[Path], files: list[Path]) -> dict[Path, list[PAR2FilePath]]:
@@ -207,37 +269,44 @@ def map_file_to_pars(basedir: Optional[Path], files: list[Path]) -> dict[Path, l
 
     `{'foo/01.ext': ['foo/01.ext.par2', 'foo/01.ext.vol12+10.par2', ...]}`
     """
+    # Every directory is listed only once, no matter how many files share it
+    # {parent: {"01.ext": ['01.ext.par2', '01.ext.vol12+10.par2', ...]}}
+    par2_by_dir: dict[Path, dict[str, list[PAR2FilePath]]] = {}
     mapping = {}
 
     for file in files:
         parent = file.parent if basedir is None else basedir
-        par2_files = []
-        # The first par2 file doesn't have the word `vol` in it
-        first_par2_file = parent / f"{file.name}.par2"
-        if first_par2_file.is_file():
-            par2_files.append(first_par2_file)
 
-        # Rest of the par2 files strictly follow the `foobar.mkv.vol01+02.par2` naming scheme
-        par2_files.extend(list(parent.glob(f"{glob.escape(file.name)}.vol*.par2")))
-        mapping[file] = natsorted(par2_files)
+        if parent not in par2_by_dir:
+            par2_by_dir[parent] = _scan_par2_files(parent)
+
+        mapping[file] = natsorted(par2_by_dir[parent].get(file.name, []))
 
     return mapping
 
 
-def move_files(files: list[Path]) -> None:
+def move_files(files: list[Path]) -> dict[Path, Path]:
     """
     Moves files into their own directories
     Example: foo/01.mkv -> foo/01/01.mkv
+
+    Returns a dictionary mapping each moved file to its new path,
+    so callers don't have to scan the directory again to find them
     """
+    moved = {}
+
     for src in files:
         if src.is_file():  # ./foo/01.mkv
             dst = src.parent / src.stem  # ./foo/01/
             dst.mkdir(parents=True, exist_ok=True)
             dst = dst / src.name  # ./foo/01/01.mkv
             src.rename(dst)  # ./foo/01.mkv -> ./foo/01/01.mkv
+            moved[src] = dst
 
             logger.debug(f"File Move: {src} -> {dst}")
 
+    return moved
+
 
 def delete_files(files: list[Path]) -> None:
     """
@@ -253,3 +322,20 @@ def delete_files(files: list[Path]) -> None:
             pass
         except OSError:  # Not empty
             pass
+
+
+@contextmanager
+def cancel_on_interrupt(*pools: ThreadPoolExecutor) -> Iterator[None]:
+    """
+    Cancel all the queued work in the given pools if the block is interrupted
+
+    Exiting a `ThreadPoolExecutor` block waits for every queued job to run,
+    so without this Ctrl-C would only stop the script after the whole batch is done.
+    Jobs that are already running are left to finish.
+    """
+    try:
+        yield
+    except BaseException:
+        for pool in pools:
+            pool.shutdown(wait=False, cancel_futures=True)
+        raise